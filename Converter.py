@@ -1,10 +1,28 @@
+import copy
+import io
 import json
+import os
+import pickle
 import re
 import sys
-import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from operator import itemgetter
 from pathlib import Path
+from threading import Lock
+from typing import NamedTuple
+
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 from musicscore import Chord, Score
+from musicscore.part import Id
 from musicxml.xmlelement.xmlelement import (
     XMLFret,
     XMLGlissando,
@@ -16,6 +34,56 @@ from musicxml.xmlelement.xmlelement import (
     XMLString,
 )
 
+_MUSICXML_PARTWISE_DOCTYPE = (
+    "<!DOCTYPE score-partwise PUBLIC\n"
+    '    "-//Recordare//DTD MusicXML 4.0 Partwise//EN"\n'
+    '    "http://www.musicxml.org/dtds/partwise.dtd">\n'
+)
+
+_UNPITCHED_TEMPLATE = ET.fromstring(
+    "<unpitched><display-step>C</display-step><display-octave>4</display-octave></unpitched>"
+)
+
+_UNPITCHED_INSERT_BEFORE_TAGS = frozenset(
+    {
+        "instrument",
+        "voice",
+        "type",
+        "dot",
+        "time-modification",
+        "stem",
+        "notehead",
+        "staff",
+        "beam",
+        "notations",
+        "lyric",
+    }
+)
+
+_STREAMED_CONTAINER_TAGS = frozenset({"score-partwise", "part"})
+
+_STEP_SEMITONES = {
+    "C": 0,
+    "D": 2,
+    "E": 4,
+    "F": 5,
+    "G": 7,
+    "A": 9,
+    "B": 11,
+}
+
+_SONG_NAME_KEYS = ("songName", "songTitle", "title", "song", "name")
+_AUTHOR_KEYS = ("author", "artist", "composer", "songAuthor", "artistName")
+_EDITOR_KEYS = ("editor", "editedBy", "editorName", "username", "revisionAuthor")
+
+_CONFIG_CACHE: dict[str, tuple[int, dict]] = {}
+
+_CONVERSION_LOCK = Lock()
+_MUSICSCORE_PATCHED = False
+
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w-]")
+_TILDE_PREFIX_RE = re.compile(r"^~\s*[\\/]")
+
 
 def _load_converter_config(config_path: Path) -> dict:
     default_config = {
@@ -24,21 +92,28 @@ def _load_converter_config(config_path: Path) -> dict:
         "default_interval_semitones": 5,
     }
 
-    if not config_path.exists():
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:
         return default_config
 
+    cache_key = str(config_path)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime:
+        return dict(cached[1])
+
     try:
         raw = config_path.read_text(encoding="utf-8")
         parsed = json.loads(raw)
     except Exception:
-        return default_config
-
-    if not isinstance(parsed, dict):
-        return default_config
+        parsed = None
 
     merged = dict(default_config)
-    merged.update(parsed)
-    return merged
+    if isinstance(parsed, dict):
+        merged.update(parsed)
+
+    _CONFIG_CACHE[cache_key] = (mtime, merged)
+    return dict(merged)
 
 
 def _resolve_output_directory(script_dir: Path, config: dict | None = None) -> Path:
@@ -60,7 +135,7 @@ def _resolve_output_directory(script_dir: Path, config: dict | None = None) -> P
 
 def _resolve_configured_path(raw_path: str) -> Path:
     cleaned = raw_path.strip().strip('"').strip("'")
-    cleaned = re.sub(r"^~\s*[\\/]", "~/", cleaned)
+    cleaned = _TILDE_PREFIX_RE.sub("~/", cleaned, count=1)
     cleaned = cleaned.replace("~\\", "~/")
 
     if cleaned == "~":
@@ -73,6 +148,11 @@ def _resolve_configured_path(raw_path: str) -> Path:
 
 
 def _patch_musicscore_rest_comparison() -> None:
+    global _MUSICSCORE_PATCHED
+    if _MUSICSCORE_PATCHED:
+        return
+    _MUSICSCORE_PATCHED = True
+
     original_has_same_pitches = Chord.has_same_pitches
 
     def safe_has_same_pitches(self: Chord, other: Chord) -> bool:
@@ -83,23 +163,29 @@ def _patch_musicscore_rest_comparison() -> None:
     Chord.has_same_pitches = safe_has_same_pitches
 
 
+def _release_musicscore_part_ids() -> None:
+    Id.__refs__.clear()
+
+
 def _safe_filename(value: str) -> str:
-    cleaned = "".join(char if char.isalnum() or char in {"-", "_"} else "_" for char in value.strip())
+    cleaned = _UNSAFE_FILENAME_RE.sub("_", value.strip())
     return cleaned or "track"
 
 
-def _first_non_empty_string(payload: dict, keys: list[str], default: str) -> str:
+def _first_non_empty_string(payload: dict, keys: tuple[str, ...], default: str) -> str:
     for key in keys:
         value = payload.get(key)
-        if isinstance(value, str) and value.strip():
-            return value.strip()
+        if isinstance(value, str):
+            stripped = value.strip()
+            if stripped:
+                return stripped
     return default
 
 
 def _resolve_song_name(payload: dict) -> str:
     return _first_non_empty_string(
         payload,
-        ["songName", "songTitle", "title", "song", "name"],
+        _SONG_NAME_KEYS,
         "track",
     )
 
@@ -116,17 +202,18 @@ def _get_quarter_duration(beat: dict) -> float:
     return (4.0 * float(numerator)) / float(denominator)
 
 
-def _beat_to_chord(beat: dict, tuning: list[int]) -> tuple[Chord, list[tuple[int, int, bool]]]:
+def _beat_to_chord(beat: dict, tuning: list[int]) -> tuple[Chord, list[tuple[int, int, bool]], bool]:
     quarter_duration = _get_quarter_duration(beat)
 
     if beat.get("rest"):
-        return Chord(0, quarter_duration), []
+        return Chord(0, quarter_duration), [], False
 
     notes = beat.get("notes", [])
     if not isinstance(notes, list) or not notes:
-        return Chord(0, quarter_duration), []
+        return Chord(0, quarter_duration), [], False
 
     midi_entries: list[tuple[int, int, int, bool]] = []
+    has_dead_notes = False
     for note in notes:
         if not isinstance(note, dict) or note.get("rest"):
             continue
@@ -140,41 +227,37 @@ def _beat_to_chord(beat: dict, tuning: list[int]) -> tuple[Chord, list[tuple[int
 
         midi_value = int(tuning[string_index]) + fret
         is_dead = bool(note.get("dead", False))
+        has_dead_notes = has_dead_notes or is_dead
         midi_entries.append((midi_value, string_index, fret, is_dead))
 
     if not midi_entries:
-        return Chord(0, quarter_duration), []
+        return Chord(0, quarter_duration), [], False
 
-    midi_entries.sort(key=lambda item: item[0])
-    midis = [midi_value for midi_value, _, _, _ in midi_entries]
-
-    if len(midis) == 1:
-        chord = Chord(midis[0], quarter_duration)
+    if len(midi_entries) == 1:
+        chord = Chord(midi_entries[0][0], quarter_duration)
     else:
-        chord = Chord(midis, quarter_duration)
+        midi_entries.sort(key=itemgetter(0))
+        chord = Chord([entry[0] for entry in midi_entries], quarter_duration)
 
-    note_positions: list[tuple[int, int, bool]] = []
-    for midi_obj, (_, string_index, fret, is_dead) in zip(chord.midis, midi_entries):
-        if is_dead:
-            midi_obj.notehead = "x"
-        note_positions.append((string_index, fret, is_dead))
+    if has_dead_notes:
+        for midi_obj, entry in zip(chord.midis, midi_entries):
+            if entry[3]:
+                midi_obj.notehead = "x"
 
-    return chord, note_positions
+    note_positions = [(string_index, fret, is_dead) for _, string_index, fret, is_dead in midi_entries]
+    return chord, note_positions, True
 
 
 def _apply_tab_technical(chord: Chord, note_positions: list[tuple[int, int, bool]]) -> None:
-    if not _is_non_rest_chord(chord) or not note_positions:
+    if not note_positions:
         return
 
     string_index, fret, is_dead = note_positions[0]
     xml_string_number = string_index + 1
 
-    chord.add_x(XMLString(xml_string_number))
-
-    if is_dead:
-        chord.add_x(XMLFret(0))
-    else:
-        chord.add_x(XMLFret(fret))
+    add_x = chord.add_x
+    add_x(XMLString(xml_string_number))
+    add_x(XMLFret(0 if is_dead else fret))
 
 
 def _resolve_dead_note_mode(payload: dict) -> str:
@@ -191,37 +274,25 @@ def _resolve_dead_note_mode(payload: dict) -> str:
     return "standard"
 
 
-def _convert_dead_notes_to_unpitched_musicxml(output_path: Path) -> None:
-    tree = ET.parse(output_path)
-    root = tree.getroot()
-
-    for note in root.iter("note"):
-        notehead = note.find("notehead")
-        if notehead is None or (notehead.text or "").strip().lower() != "x":
-            continue
-
-        pitch = note.find("pitch")
-        if pitch is None:
-            continue
-
-        note.remove(pitch)
+def _convert_dead_note_to_unpitched(note: ET.Element) -> None:
+    notehead = note.find("notehead")
+    if notehead is None or (notehead.text or "").strip().lower() != "x":
+        return
 
-        unpitched = ET.Element("unpitched")
-        display_step = ET.SubElement(unpitched, "display-step")
-        display_step.text = "C"
-        display_octave = ET.SubElement(unpitched, "display-octave")
-        display_octave.text = "4"
+    pitch = note.find("pitch")
+    if pitch is None:
+        return
 
-        insertion_index = 0
-        for index, child in enumerate(list(note)):
-            if child.tag in {"instrument", "voice", "type", "dot", "time-modification", "stem", "notehead", "staff", "beam", "notations", "lyric"}:
-                insertion_index = index
-                break
-            insertion_index = index + 1
+    note.remove(pitch)
 
-        note.insert(insertion_index, unpitched)
+    insertion_index = 0
+    for index, child in enumerate(list(note)):
+        if child.tag in _UNPITCHED_INSERT_BEFORE_TAGS:
+            insertion_index = index
+            break
+        insertion_index = index + 1
 
-    tree.write(output_path, encoding="UTF-8", xml_declaration=True)
+    note.insert(insertion_index, copy.deepcopy(_UNPITCHED_TEMPLATE))
 
 
 def _pitch_to_midi(pitch_element: ET.Element) -> int | None:
@@ -229,17 +300,7 @@ def _pitch_to_midi(pitch_element: ET.Element) -> int | None:
     octave_text = (pitch_element.findtext("octave") or "").strip()
     alter_text = (pitch_element.findtext("alter") or "0").strip()
 
-    semitones = {
-        "C": 0,
-        "D": 2,
-        "E": 4,
-        "F": 5,
-        "G": 7,
-        "A": 9,
-        "B": 11,
-    }
-
-    if step_text not in semitones:
+    if step_text not in _STEP_SEMITONES:
         return None
 
     try:
@@ -248,24 +309,28 @@ def _pitch_to_midi(pitch_element: ET.Element) -> int | None:
     except Exception:
         return None
 
-    return (octave + 1) * 12 + semitones[step_text] + alter
+    return (octave + 1) * 12 + _STEP_SEMITONES[step_text] + alter
 
 
 def _infer_string_and_fret_from_midi(midi_value: int, tuning: list[int]) -> tuple[int, int] | None:
-    candidates: list[tuple[int, int]] = []
+    best: tuple[int, int] | None = None
     for string_index, open_string_midi in enumerate(tuning):
         fret = midi_value - int(open_string_midi)
-        if fret >= 0:
-            candidates.append((string_index, fret))
+        if fret >= 0 and (best is None or fret < best[1]):
+            best = (string_index, fret)
 
-    if not candidates:
-        return None
+    return best
 
-    candidates.sort(key=lambda item: (item[1], item[0]))
-    return candidates[0]
 
+def _build_string_fret_lookup(tuning: list[int]) -> list[tuple[int, int] | None]:
+    return [_infer_string_and_fret_from_midi(midi_value, tuning) for midi_value in range(128)]
 
-def _ensure_note_has_technical_string_fret(note: ET.Element, tuning: list[int]) -> None:
+
+def _ensure_note_has_technical_string_fret(
+    note: ET.Element,
+    tuning: list[int],
+    position_lookup: list[tuple[int, int] | None],
+) -> None:
     if note.find("rest") is not None:
         return
 
@@ -293,7 +358,10 @@ def _ensure_note_has_technical_string_fret(note: ET.Element, tuning: list[int])
     if pitch is not None and tuning:
         midi_value = _pitch_to_midi(pitch)
         if midi_value is not None:
-            inferred = _infer_string_and_fret_from_midi(midi_value, tuning)
+            if 0 <= midi_value < len(position_lookup):
+                inferred = position_lookup[midi_value]
+            else:
+                inferred = _infer_string_and_fret_from_midi(midi_value, tuning)
             if inferred is not None:
                 inferred_string_number = inferred[0] + 1
                 inferred_fret = inferred[1]
@@ -317,19 +385,85 @@ def _ensure_note_has_technical_string_fret(note: ET.Element, tuning: list[int])
         existing_fret.text = str(inferred_fret)
 
 
-def _ensure_string_fret_for_all_notes_musicxml(output_path: Path, tuning: list[int]) -> None:
-    tree = ET.parse(output_path)
-    root = tree.getroot()
-
-    for note in root.iter("note"):
-        _ensure_note_has_technical_string_fret(note, tuning)
+def _postprocess_note(
+    note: ET.Element,
+    tuning: list[int],
+    position_lookup: list[tuple[int, int] | None],
+    convert_dead_notes: bool,
+) -> None:
+    _ensure_note_has_technical_string_fret(note, tuning, position_lookup)
+    if convert_dead_notes:
+        _convert_dead_note_to_unpitched(note)
+
+
+def _stream_postprocessed_musicxml(
+    xml_source: io.BytesIO,
+    output_path: Path,
+    tuning: list[int],
+    position_lookup: list[tuple[int, int] | None],
+    convert_dead_notes: bool,
+) -> None:
+    open_containers: list = []
+    depth = 0
+
+    with ET.xmlfile(str(output_path), encoding="UTF-8") as xml_file:
+        xml_file.write_declaration()
+        xml_file.write_doctype(_MUSICXML_PARTWISE_DOCTYPE.strip())
+
+        for event, element in ET.iterparse(xml_source, events=("start", "end")):
+            if event == "start":
+                if element.tag in _STREAMED_CONTAINER_TAGS and depth == len(open_containers):
+                    container = xml_file.element(element.tag, dict(element.attrib))
+                    container.__enter__()
+                    open_containers.append(container)
+                depth += 1
+                continue
 
-    tree.write(output_path, encoding="UTF-8", xml_declaration=True)
+            depth -= 1
+            if element.tag == "note":
+                _postprocess_note(element, tuning, position_lookup, convert_dead_notes)
+
+            if depth < len(open_containers):
+                open_containers.pop().__exit__(None, None, None)
+                if element.tail:
+                    xml_file.write(element.tail)
+            elif depth == len(open_containers):
+                parent = element.getparent()
+                if element.getprevious() is None and parent is not None and parent.text:
+                    xml_file.write(parent.text)
+
+                xml_file.write(element)
+                element.clear(keep_tail=True)
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
+def _postprocess_musicxml(score: Score, output_path: Path, tuning: list[int], dead_note_mode: str) -> None:
+    convert_dead_notes = dead_note_mode == "unpitched"
+    position_lookup = _build_string_fret_lookup(tuning)
+    xml_source = io.BytesIO((_MUSICXML_PARTWISE_DOCTYPE + score.to_string()).encode("utf-8"))
+
+    # Write next to the target and swap it in only once the whole document is out,
+    # so a failure never leaves a truncated file at output_path.
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    try:
+        if hasattr(ET, "xmlfile"):
+            _stream_postprocessed_musicxml(xml_source, tmp_path, tuning, position_lookup, convert_dead_notes)
+        else:
+            events = ET.iterparse(xml_source, events=("end",))
+            for _, element in events:
+                if element.tag == "note":
+                    _postprocess_note(element, tuning, position_lookup, convert_dead_notes)
 
+            tree = ET.ElementTree(events.root)
+            tree.write(str(tmp_path), encoding="UTF-8", xml_declaration=True)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
-def _iter_note_dicts(measures: list[dict]) -> list[dict]:
-    notes: list[dict] = []
 
+def _iter_note_dicts(measures: list[dict]) -> Iterator[dict]:
     for measure in measures:
         if not isinstance(measure, dict):
             continue
@@ -356,9 +490,7 @@ def _iter_note_dicts(measures: list[dict]) -> list[dict]:
 
                 for note in beat_notes:
                     if isinstance(note, dict):
-                        notes.append(note)
-
-    return notes
+                        yield note
 
 
 def _normalize_tuning(raw_tuning: object) -> list[int]:
@@ -409,13 +541,18 @@ def _guess_string_count(payload: dict, measures: list[dict]) -> int:
     if isinstance(payload_strings, int) and payload_strings > 0:
         return payload_strings
 
-    max_string_index = -1
-    for note in _iter_note_dicts(measures):
-        if note.get("rest"):
-            continue
-        string_index = note.get("string")
-        if isinstance(string_index, int) and string_index > max_string_index:
-            max_string_index = string_index
+    return _count_strings_in_notes(measures)
+
+
+def _count_strings_in_notes(measures: list[dict]) -> int:
+    max_string_index = max(
+        (
+            note["string"]
+            for note in _iter_note_dicts(measures)
+            if isinstance(note.get("string"), int) and not note.get("rest")
+        ),
+        default=-1,
+    )
 
     return max_string_index + 1 if max_string_index >= 0 else 0
 
@@ -458,10 +595,19 @@ def _resolve_tuning(payload: dict, measures: list[dict], config: dict | None = N
     return _default_tuning_for_track(payload, measures, config=config)
 
 
-def _extract_beat_effects(beat: dict) -> dict[str, bool | str | None]:
+class _BeatEffects(NamedTuple):
+    staccato: bool
+    hp: bool
+    slide: str | None
+
+
+_EMPTY_BEAT_EFFECTS = _BeatEffects(False, False, None)
+
+
+def _extract_beat_effects(beat: dict) -> _BeatEffects:
     notes = beat.get("notes", [])
-    if not isinstance(notes, list):
-        return {"staccato": False, "hp": False, "slide": None}
+    if not isinstance(notes, list) or not notes:
+        return _EMPTY_BEAT_EFFECTS
 
     has_staccato = False
     has_hammer_pull = False
@@ -480,11 +626,10 @@ def _extract_beat_effects(beat: dict) -> dict[str, bool | str | None]:
         if isinstance(raw_slide, str) and raw_slide.strip() and slide_type is None:
             slide_type = raw_slide.strip().lower()
 
-    return {"staccato": has_staccato, "hp": has_hammer_pull, "slide": slide_type}
+        if has_staccato and has_hammer_pull and slide_type is not None:
+            break
 
-
-def _is_non_rest_chord(chord: Chord | None) -> bool:
-    return bool(chord is not None and not getattr(chord, "is_rest", False))
+    return _BeatEffects(has_staccato, has_hammer_pull, slide_type)
 
 
 def _lowest_chord_midi(chord: Chord) -> int | None:
@@ -498,8 +643,11 @@ def _lowest_chord_midi(chord: Chord) -> int | None:
 
 
 def _apply_hp_slur(previous_chord: Chord, current_chord: Chord) -> None:
-    previous_chord.add_x(XMLSlur(type="start", number=1))
-    current_chord.add_x(XMLSlur(type="stop", number=1))
+    add_to_previous = previous_chord.add_x
+    add_to_current = current_chord.add_x
+
+    add_to_previous(XMLSlur(type="start", number=1))
+    add_to_current(XMLSlur(type="stop", number=1))
 
     previous_pitch = _lowest_chord_midi(previous_chord)
     current_pitch = _lowest_chord_midi(current_chord)
@@ -507,22 +655,25 @@ def _apply_hp_slur(previous_chord: Chord, current_chord: Chord) -> None:
         return
 
     if current_pitch >= previous_pitch:
-        previous_chord.add_x(XMLHammerOn(type="start", number=1))
-        current_chord.add_x(XMLHammerOn(type="stop", number=1))
+        add_to_previous(XMLHammerOn(type="start", number=1))
+        add_to_current(XMLHammerOn(type="stop", number=1))
     else:
-        previous_chord.add_x(XMLPullOff(type="start", number=1))
-        current_chord.add_x(XMLPullOff(type="stop", number=1))
+        add_to_previous(XMLPullOff(type="start", number=1))
+        add_to_current(XMLPullOff(type="stop", number=1))
 
 
 def _apply_slide_connection(start_chord: Chord, stop_chord: Chord, slide_type: str | None) -> None:
-    start_chord.add_x(XMLGlissando(type="start", number=1))
-    stop_chord.add_x(XMLGlissando(type="stop", number=1))
-    start_chord.add_x(XMLSlide(type="start", number=1))
-    stop_chord.add_x(XMLSlide(type="stop", number=1))
+    add_to_start = start_chord.add_x
+    add_to_stop = stop_chord.add_x
+
+    add_to_start(XMLGlissando(type="start", number=1))
+    add_to_stop(XMLGlissando(type="stop", number=1))
+    add_to_start(XMLSlide(type="start", number=1))
+    add_to_stop(XMLSlide(type="stop", number=1))
 
     if slide_type == "legato":
-        start_chord.add_x(XMLSlur(type="start", number=1))
-        stop_chord.add_x(XMLSlur(type="stop", number=1))
+        add_to_start(XMLSlur(type="start", number=1))
+        add_to_stop(XMLSlur(type="stop", number=1))
 
 
 def convert_track_json_to_musicxml(payload: dict, output_dir: Path, config: dict | None = None) -> Path:
@@ -557,10 +708,8 @@ def convert_track_json_to_musicxml(payload: dict, output_dir: Path, config: dict
     part = score.add_part("P1")
     part.name = str(payload.get("instrument") or track_name)
 
-    sorted_measures = sorted(
-        [measure for measure in measures if isinstance(measure, dict)],
-        key=lambda measure: int(measure.get("index", 0)),
-    )
+    sorted_measures = [measure for measure in measures if isinstance(measure, dict)]
+    sorted_measures.sort(key=lambda measure: int(measure.get("index", 0)))
 
     previous_signature: tuple[int, int] | None = None
     for measure_data in sorted_measures:
@@ -606,30 +755,30 @@ def convert_track_json_to_musicxml(payload: dict, output_dir: Path, config: dict
             if not isinstance(beat, dict):
                 continue
 
-            chord, note_positions = _beat_to_chord(beat, tuning)
-            effects = _extract_beat_effects(beat)
+            chord, note_positions, is_non_rest = _beat_to_chord(beat, tuning)
+            effects = _extract_beat_effects(beat) if is_non_rest else _EMPTY_BEAT_EFFECTS
 
             _apply_tab_technical(chord, note_positions)
 
-            if _is_non_rest_chord(chord) and bool(effects["staccato"]):
+            if is_non_rest and effects.staccato:
                 chord.add_x(XMLStaccato())
 
-            if _is_non_rest_chord(pending_hp_start) and _is_non_rest_chord(chord):
+            if pending_hp_start is not None and is_non_rest:
                 _apply_hp_slur(pending_hp_start, chord)
                 pending_hp_start = None
 
-            if _is_non_rest_chord(pending_slide_start) and _is_non_rest_chord(chord):
+            if pending_slide_start is not None and is_non_rest:
                 _apply_slide_connection(pending_slide_start, chord, pending_slide_type)
                 pending_slide_start = None
                 pending_slide_type = None
 
-            if _is_non_rest_chord(chord) and bool(effects["hp"]):
+            if is_non_rest and effects.hp:
                 pending_hp_start = chord
 
-            if _is_non_rest_chord(chord) and isinstance(effects["slide"], str):
+            if is_non_rest and effects.slide is not None:
                 pending_slide_start = chord
-                pending_slide_type = str(effects["slide"])
-            elif getattr(chord, "is_rest", False):
+                pending_slide_type = effects.slide
+            elif not is_non_rest:
                 pending_hp_start = None
                 pending_slide_start = None
                 pending_slide_type = None
@@ -640,55 +789,68 @@ def convert_track_json_to_musicxml(payload: dict, output_dir: Path, config: dict
 
     author_name = _first_non_empty_string(
         payload,
-        ["author", "artist", "composer", "songAuthor", "artistName"],
+        _AUTHOR_KEYS,
         "unknown-author",
     )
     editor_name = _first_non_empty_string(
         payload,
-        ["editor", "editedBy", "editorName", "username", "revisionAuthor"],
+        _EDITOR_KEYS,
         str(revision_id),
     )
 
     output_name = _safe_filename(f"{song_name}-{author_name}-{editor_name}") + ".musicxml"
     output_path = output_dir / output_name
-    score.export_xml(output_path)
+    _postprocess_musicxml(score, output_path, tuning, dead_note_mode)
 
-    _ensure_string_fret_for_all_notes_musicxml(output_path, tuning)
+    return output_path
 
-    if dead_note_mode == "unpitched":
-        _convert_dead_notes_to_unpitched_musicxml(output_path)
 
-    return output_path
+def convert(payload: dict) -> tuple[bool, str]:
+    if not isinstance(payload, dict):
+        return False, "Payload must be a JSON object."
+
+    with _CONVERSION_LOCK:
+        try:
+            _patch_musicscore_rest_comparison()
+            script_dir = Path(__file__).resolve().parent
+            config = _load_converter_config(script_dir / "converter.config")
+
+            output_path = convert_track_json_to_musicxml(
+                payload,
+                _resolve_output_directory(script_dir, config=config),
+                config=config,
+            )
+        except Exception as exc:
+            return False, f"Converter.py error: {exc}"
+        finally:
+            _release_musicscore_part_ids()
+
+    return True, f"MusicXML written to: {output_path}"
 
 
 def main() -> int:
     try:
-        _patch_musicscore_rest_comparison()
-        script_dir = Path(__file__).resolve().parent
-        config = _load_converter_config(script_dir / "converter.config")
-
-        raw_input = sys.stdin.read()
-        if not raw_input.strip():
-            print("No JSON payload received.", file=sys.stderr)
-            return 1
-
-        payload = json.loads(raw_input)
-        if not isinstance(payload, dict):
-            print("Payload must be a JSON object.", file=sys.stderr)
-            return 1
-
-        output_path = convert_track_json_to_musicxml(
-            payload,
-            _resolve_output_directory(script_dir, config=config),
-            config=config,
-        )
-        print(f"MusicXML written to: {output_path}")
-
-        return 0
+        if "--pickle" in sys.argv[1:]:
+            payload = pickle.load(sys.stdin.buffer)
+        else:
+            raw_input = sys.stdin.buffer.read()
+            if not raw_input.strip():
+                print("No JSON payload received.", file=sys.stderr)
+                return 1
+
+            payload = _json_loads(raw_input)
     except Exception as exc:
         print(f"Converter.py error: {exc}", file=sys.stderr)
         return 1
 
+    success, message = convert(payload)
+    if not success:
+        print(message, file=sys.stderr)
+        return 1
+
+    print(message)
+    return 0
+
 
 if __name__ == "__main__":
     raise SystemExit(main())
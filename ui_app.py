@@ -1,27 +1,208 @@
+import importlib.util
+import io
 import json
 import gzip
+import hashlib
+import os
+import pickle
 import subprocess
 import sys
+import tempfile
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager, suppress
+from functools import lru_cache, wraps
+from http.client import HTTPConnection, HTTPResponse, HTTPSConnection, RemoteDisconnected
 from pathlib import Path
-from threading import Lock, Thread
+from threading import Condition, Lock
 from urllib.error import HTTPError
-from urllib.parse import quote, urlencode
-from urllib.request import Request, urlopen
+from urllib.parse import quote, urlencode, urljoin, urlsplit
+from urllib.request import Request, getproxies, proxy_bypass, urlopen
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+from platformdirs import user_cache_path
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Button, Input, Label, ListItem, ListView, Static
+from textual.worker import Worker, get_current_worker
+
+_REQUEST_HEADERS = {
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip",
+    "User-Agent": f"Python-urllib/{sys.version_info.major}.{sys.version_info.minor}",
+}
+_REQUEST_TIMEOUT = 10
+_META_PREFETCH_WORKERS = 8
+_TRACK_PREFETCH_WORKERS = 4
+_TRACK_JSON_CACHE_SIZE = 32
+_MAX_REDIRECTS = 5
+_MAX_IDLE_CONNECTIONS_PER_HOST = 8
+_STALE_CONNECTION_ERRORS = (RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+_AUTHOR_KEYS = ("author", "tabAuthor", "composer", "username")
+_DISK_CACHE_DIR = user_cache_path("songsterr", appauthor=False)
+_DISK_CACHE_MAX_AGE = 24 * 60 * 60
+_DISK_CACHE_MAX_BYTES = 128 * 1024 * 1024
+_DISK_CACHE_PRUNE_INTERVAL = 5 * 60
+
+_PROXIES = getproxies()
+
+_idle_connections: dict[tuple[str, str], list[HTTPConnection]] = {}
+_idle_connections_lock = Lock()
+
+# Shared across screens so payloads prefetched from the results list are reused;
+# only recent payloads are kept in memory, the disk cache covers the rest.
+_track_json_cache: OrderedDict[str, dict] = OrderedDict()
+_track_json_cache_lock = Lock()
+
+_disk_cache_pruned_at: dict[Path, float] = {}
+_disk_cache_prune_lock = Lock()
+
+_converter_module = None
+_converter_module_lock = Lock()
 
 
 def _read_json_response(response) -> dict | list:
-    raw_bytes = response.read()
-    content_encoding = str(response.headers.get("Content-Encoding", "")).lower()
+    # peek() may return fewer than two bytes (short first chunk or read), so the
+    # magic-byte check only short-circuits the Content-Encoding lookup. An empty
+    # body must not be peeked at all: that would block on the kept-alive socket.
+    if response.length != 0 and (
+        response.peek(2).startswith(b"\x1f\x8b")
+        or "gzip" in response.getheader("Content-Encoding", "").lower()
+    ):
+        with gzip.GzipFile(fileobj=response) as stream:
+            raw_bytes = stream.read()
+    else:
+        raw_bytes = response.read()
+
+    return _json_loads(raw_bytes)
+
+
+def _read_error_details(exc: HTTPError) -> str:
+    body = exc.read()
+    content_encoding = exc.headers.get("Content-Encoding", "") if exc.headers is not None else ""
+    # Error bodies are gzip-encoded too since every request asks for gzip.
+    if body.startswith(b"\x1f\x8b") or "gzip" in content_encoding.lower():
+        with suppress(OSError, EOFError, zlib.error):
+            body = gzip.decompress(body)
+    return body.decode("utf-8", errors="replace")
+
+
+def _new_connection(origin: tuple[str, str]) -> HTTPConnection:
+    scheme, host = origin
+    connection_class = HTTPSConnection if scheme == "https" else HTTPConnection
+    return connection_class(host, timeout=_REQUEST_TIMEOUT)
+
+
+def _acquire_connection(origin: tuple[str, str]) -> tuple[HTTPConnection, bool]:
+    with _idle_connections_lock:
+        idle = _idle_connections.get(origin)
+        if idle:
+            return idle.pop(), True
+
+    return _new_connection(origin), False
+
+
+def _release_connection(origin: tuple[str, str], connection: HTTPConnection, response: HTTPResponse) -> None:
+    if not response.isclosed() or response.will_close:
+        connection.close()
+        return
+
+    with _idle_connections_lock:
+        idle = _idle_connections.setdefault(origin, [])
+        if len(idle) < _MAX_IDLE_CONNECTIONS_PER_HOST:
+            idle.append(connection)
+            return
+
+    connection.close()
+
+
+def _request_on(connection: HTTPConnection, target: str) -> HTTPResponse:
+    try:
+        connection.request("GET", target, headers=_REQUEST_HEADERS)
+        return connection.getresponse()
+    except BaseException:
+        connection.close()
+        raise
+
+
+def _send_get_request(origin: tuple[str, str], target: str) -> tuple[HTTPConnection, HTTPResponse]:
+    connection, reused = _acquire_connection(origin)
+    try:
+        return connection, _request_on(connection, target)
+    except _STALE_CONNECTION_ERRORS:
+        if not reused:
+            raise
+
+    # The server dropped the idle keep-alive connection; retry once on a fresh one.
+    connection = _new_connection(origin)
+    return connection, _request_on(connection, target)
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    return scheme in _PROXIES and not proxy_bypass(host)
+
+
+@contextmanager
+def _pooled_urlopen(url: str) -> Iterator[HTTPResponse]:
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        if _uses_proxy(parts.scheme, parts.hostname or ""):
+            # The pool talks to origins directly; let urlopen handle proxied requests.
+            with urlopen(Request(url, headers=_REQUEST_HEADERS), timeout=_REQUEST_TIMEOUT) as response:
+                yield response
+            return
 
-    if "gzip" in content_encoding or raw_bytes.startswith(b"\x1f\x8b"):
-        raw_bytes = gzip.decompress(raw_bytes)
+        origin = (parts.scheme, parts.netloc)
+        target = f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
 
-    return json.loads(raw_bytes.decode("utf-8"))
+        connection, response = _send_get_request(origin, target)
+        location = response.getheader("Location")
+        if response.status in {301, 302, 303, 307, 308} and location:
+            response.read()
+            _release_connection(origin, connection, response)
+            url = urljoin(url, location)
+            continue
+
+        if response.status >= 300:
+            body = response.read()
+            _release_connection(origin, connection, response)
+            raise HTTPError(url, response.status, response.reason, response.headers, io.BytesIO(body))
+
+        try:
+            yield response
+        except BaseException:
+            connection.close()
+            raise
+
+        _release_connection(origin, connection, response)
+        return
+
+    raise RuntimeError("Too many redirects.")
+
+
+def _load_converter_module(script_path: Path):
+    global _converter_module
+
+    with _converter_module_lock:
+        if _converter_module is None:
+            spec = importlib.util.spec_from_file_location("Converter", script_path)
+            if spec is None or spec.loader is None:
+                raise ImportError(f"Cannot load Converter.py from: {script_path}")
+
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _converter_module = module
+
+    return _converter_module
 
 
 def send_json_to_score(track_json: dict) -> tuple[bool, str]:
@@ -29,13 +210,21 @@ def send_json_to_score(track_json: dict) -> tuple[bool, str]:
     if not script_path.exists():
         return False, f"Converter.py not found at: {script_path}"
 
-    payload = json.dumps(track_json, ensure_ascii=False)
+    try:
+        converter = _load_converter_module(script_path)
+    except Exception:
+        return _send_json_to_score_subprocess(script_path, track_json)
+
+    return converter.convert(track_json)
+
+
+def _send_json_to_score_subprocess(script_path: Path, track_json: dict) -> tuple[bool, str]:
+    payload = pickle.dumps(track_json, protocol=pickle.HIGHEST_PROTOCOL)
 
     try:
         result = subprocess.run(
-            [sys.executable, str(script_path)],
+            [sys.executable, str(script_path), "--pickle"],
             input=payload,
-            text=True,
             capture_output=True,
             timeout=120,
             check=False,
@@ -43,8 +232,8 @@ def send_json_to_score(track_json: dict) -> tuple[bool, str]:
     except Exception as exc:
         return False, f"Failed to execute Converter.py: {exc}"
 
-    stdout_text = result.stdout.strip()
-    stderr_text = result.stderr.strip()
+    stdout_text = result.stdout.decode("utf-8", errors="replace").strip()
+    stderr_text = result.stderr.decode("utf-8", errors="replace").strip()
 
     if result.returncode == 0:
         message = stdout_text or "Converter.py completed successfully."
@@ -62,6 +251,89 @@ def send_json_to_score(track_json: dict) -> tuple[bool, str]:
     return False, error_message
 
 
+def _read_disk_cache(cache_path: Path) -> dict | None:
+    try:
+        if time.time() - cache_path.stat().st_mtime >= _DISK_CACHE_MAX_AGE:
+            return None
+        with gzip.open(cache_path, "rb") as cache_file:
+            data = _json_loads(cache_file.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, EOFError, ValueError, zlib.error):
+        # Corrupt or unreadable entry: drop it so the next fetch rewrites it.
+        with suppress(OSError):
+            cache_path.unlink()
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_disk_cache(cache_path: Path, data: dict) -> None:
+    payload = gzip.compress(
+        json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        compresslevel=1,
+    )
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    except OSError:
+        return
+
+    try:
+        with os.fdopen(tmp_fd, "wb") as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_name, cache_path)
+    except OSError:
+        with suppress(OSError):
+            os.unlink(tmp_name)
+
+
+def _prune_disk_cache(cache_dir: Path) -> None:
+    now = time.time()
+    with _disk_cache_prune_lock:
+        if now - _disk_cache_pruned_at.get(cache_dir, 0.0) < _DISK_CACHE_PRUNE_INTERVAL:
+            return
+        _disk_cache_pruned_at[cache_dir] = now
+
+    entries: list[tuple[float, int, str]] = []
+    try:
+        with os.scandir(cache_dir) as scan:
+            for entry in scan:
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    except OSError:
+        return
+
+    # Newest entries are kept first; anything expired or past the size budget goes.
+    entries.sort(reverse=True)
+    total_size = 0
+    for mtime, size, path in entries:
+        total_size += size
+        if now - mtime >= _DISK_CACHE_MAX_AGE or total_size > _DISK_CACHE_MAX_BYTES:
+            with suppress(OSError):
+                os.unlink(path)
+
+
+def _disk_cached(namespace: str):
+    def decorator(fetch):
+        @wraps(fetch)
+        def wrapper(*args: str) -> dict:
+            key_source = json.dumps([str(arg).strip() for arg in args]).encode("utf-8")
+            cache_path = _DISK_CACHE_DIR / namespace / f"{hashlib.sha256(key_source).hexdigest()}.json.gz"
+            data = _read_disk_cache(cache_path)
+            if data is None:
+                data = fetch(*args)
+                _write_disk_cache(cache_path, data)
+                _prune_disk_cache(cache_path.parent)
+            return data
+
+        return wrapper
+
+    return decorator
+
+
 def search_songs(song_search: str, instrument: str) -> list[dict]:
     song_search = song_search.strip()
     if not song_search:
@@ -69,8 +341,6 @@ def search_songs(song_search: str, instrument: str) -> list[dict]:
 
     query_params = {
         "pattern": song_search,
-        "tuning": "undefined",
-        "difficulty": "undefined",
         "size": 50,
         "from": 0,
         "more": "true",
@@ -80,13 +350,11 @@ def search_songs(song_search: str, instrument: str) -> list[dict]:
 
     url = f"https://www.songsterr.com/api/search?{urlencode(query_params)}"
 
-    request = Request(url, headers={"Accept": "application/json"})
-
     try:
-        with urlopen(request, timeout=10) as response:
+        with _pooled_urlopen(url) as response:
             data = _read_json_response(response)
     except HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="replace")
+        details = _read_error_details(exc)
         raise RuntimeError(
             f"Request failed: HTTP {exc.code} {exc.reason}\nURL: {url}\n{details}"
         ) from exc
@@ -100,6 +368,7 @@ def search_songs(song_search: str, instrument: str) -> list[dict]:
     return data if isinstance(data, list) else []
 
 
+@_disk_cached("meta")
 def search_song_meta(song_id: str) -> dict:
     song_id = song_id.strip()
     if not song_id:
@@ -107,13 +376,11 @@ def search_song_meta(song_id: str) -> dict:
 
     url = f"https://www.songsterr.com/api/meta/{song_id}"
 
-    request = Request(url, headers={"Accept": "application/json"})
-
     try:
-        with urlopen(request, timeout=10) as response:
+        with _pooled_urlopen(url) as response:
             data = _read_json_response(response)
     except HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="replace")
+        details = _read_error_details(exc)
         raise RuntimeError(
             f"Request failed: HTTP {exc.code} {exc.reason}\nURL: {url}\n{details}"
         ) from exc
@@ -126,27 +393,35 @@ def search_song_meta(song_id: str) -> dict:
     raise RuntimeError("Unexpected meta response format.")
 
 
-def get_song_tabs(song_id: str, revision_id: str, image: str, selected_track_id: str) -> dict:
-    if not song_id.strip() or not revision_id.strip() or not image.strip() or not selected_track_id.strip():
+@lru_cache(maxsize=256)
+def _build_track_url(song_id: str, revision_id: str, image: str, track_id: str) -> str:
+    song_id = song_id.strip()
+    revision_id = revision_id.strip()
+    image = image.strip()
+    track_id = track_id.strip()
+    if not (song_id and revision_id and image and track_id):
         raise ValueError("Missing required values for track JSON request.")
 
-    safe_song_id = quote(song_id.strip(), safe="")
-    safe_revision_id = quote(revision_id.strip(), safe="")
-    safe_image = quote(image.strip(), safe="")
-    safe_track_id = quote(selected_track_id.strip(), safe="")
+    safe_song_id = quote(song_id, safe="")
+    safe_revision_id = quote(revision_id, safe="")
+    safe_image = quote(image, safe="")
+    safe_track_id = quote(track_id, safe="")
 
-    url = (
+    return (
         "https://dqsljvtekg760.cloudfront.net/"
         f"{safe_song_id}/{safe_revision_id}/{safe_image}/{safe_track_id}.json"
     )
 
-    request = Request(url, headers={"Accept": "application/json"})
+
+@_disk_cached("tracks")
+def get_song_tabs(song_id: str, revision_id: str, image: str, selected_track_id: str) -> dict:
+    url = _build_track_url(song_id, revision_id, image, selected_track_id)
 
     try:
-        with urlopen(request, timeout=10) as response:
+        with _pooled_urlopen(url) as response:
             data = _read_json_response(response)
     except HTTPError as exc:
-        details = exc.read().decode("utf-8", errors="replace")
+        details = _read_error_details(exc)
         raise RuntimeError(
             f"Track request failed: HTTP {exc.code} {exc.reason}\nURL: {url}\n{details}"
         ) from exc
@@ -159,6 +434,140 @@ def get_song_tabs(song_id: str, revision_id: str, image: str, selected_track_id:
     raise RuntimeError("Unexpected track JSON response format.")
 
 
+def _meta_track_source(meta: dict) -> tuple[str, str]:
+    revision_id = str(meta.get("revisionId") or meta.get("revision") or "").strip()
+    image = str(meta.get("image") or meta.get("imageId") or "").strip()
+    return revision_id, image
+
+
+def _resolve_track_source(meta_revision_id: str, meta_image: str, track: dict) -> tuple[str, str]:
+    revision_id = meta_revision_id or str(track.get("revisionId") or track.get("revision") or "").strip()
+    image = meta_image or str(track.get("image") or track.get("imageId") or "").strip()
+    return revision_id, image
+
+
+def _track_cache_key(song_id: str, revision_id: str, image: str, track_id: str) -> str:
+    return f"{song_id}:{revision_id}:{image}:{track_id}"
+
+
+def _has_cached_track_json(cache_key: str) -> bool:
+    with _track_json_cache_lock:
+        return cache_key in _track_json_cache
+
+
+def _get_cached_track_json(cache_key: str) -> dict | None:
+    with _track_json_cache_lock:
+        track_json = _track_json_cache.get(cache_key)
+        if track_json is not None:
+            _track_json_cache.move_to_end(cache_key)
+        return track_json
+
+
+def _cache_track_json(cache_key: str, track_json: dict) -> None:
+    with _track_json_cache_lock:
+        _track_json_cache[cache_key] = track_json
+        _track_json_cache.move_to_end(cache_key)
+        while len(_track_json_cache) > _TRACK_JSON_CACHE_SIZE:
+            _track_json_cache.popitem(last=False)
+
+
+def _enrich_track_json(track_json: dict, meta: dict, song_title: str) -> dict:
+    enriched_track_json = dict(track_json)
+
+    song_title = str(meta.get("title") or song_title or "").strip()
+    if song_title:
+        enriched_track_json["songName"] = song_title
+        enriched_track_json["songTitle"] = song_title
+        enriched_track_json["title"] = song_title
+
+    artist_name = ""
+    meta_artist = meta.get("artist")
+    if isinstance(meta_artist, dict):
+        artist_name = str(meta_artist.get("name") or "").strip()
+    elif isinstance(meta_artist, str):
+        artist_name = meta_artist.strip()
+
+    if artist_name:
+        enriched_track_json["artist"] = artist_name
+
+    author_name = _pick_name(meta)
+    if author_name:
+        enriched_track_json["author"] = author_name
+
+    editor_name = str(
+        meta.get("editor")
+        or meta.get("editedBy")
+        or meta.get("editorName")
+        or meta.get("revisionAuthor")
+        or meta.get("username")
+        or ""
+    ).strip()
+    if editor_name:
+        enriched_track_json["editor"] = editor_name
+
+    return enriched_track_json
+
+
+def _pick_name(data: dict, keys: tuple[str, ...] = _AUTHOR_KEYS) -> str:
+    for key in keys:
+        candidate = data.get(key)
+        if isinstance(candidate, dict):
+            candidate = candidate.get("name") or candidate.get("username")
+        if isinstance(candidate, str):
+            candidate = candidate.strip()
+            if candidate:
+                return candidate
+    return ""
+
+
+def _summarize_song_meta(meta: dict) -> dict[str, str | None]:
+    meta_artist = meta.get("artist")
+    if isinstance(meta_artist, dict):
+        meta_artist_name = meta_artist.get("name") or None
+    elif isinstance(meta_artist, str):
+        meta_artist_name = meta_artist
+    else:
+        meta_artist_name = None
+
+    meta_author_name = _pick_name(meta) or "N/A"
+
+    tags_value = meta.get("tags", [])
+    if isinstance(tags_value, list):
+        parsed_tags: list[str] = []
+        for tag in tags_value:
+            if isinstance(tag, str):
+                parsed_tags.append(tag)
+            elif isinstance(tag, dict):
+                name = tag.get("name")
+                if isinstance(name, str):
+                    parsed_tags.append(name)
+        tags_text = ", ".join(parsed_tags) if parsed_tags else "N/A"
+    else:
+        tags_text = "N/A"
+
+    tracks = meta.get("tracks", [])
+    instrument_names: list[str] = []
+    if isinstance(tracks, list):
+        for track in tracks:
+            if isinstance(track, dict):
+                instrument_name = track.get("instrument")
+                if isinstance(instrument_name, str) and instrument_name:
+                    instrument_names.append(instrument_name)
+
+    unique_instruments = sorted(set(instrument_names))
+    instruments_text = ", ".join(unique_instruments) if unique_instruments else "N/A"
+
+    raw_title = meta.get("title")
+
+    return {
+        "title": str(raw_title) if raw_title is not None else None,
+        "artist": meta_artist_name,
+        "author": meta_author_name,
+        "tags_text": tags_text,
+        "instruments_text": instruments_text,
+    }
+
+
 class SongResultsScreen(Screen):
     CSS = """
     Screen {
@@ -197,8 +606,17 @@ class SongResultsScreen(Screen):
     def __init__(self, records: list[dict]) -> None:
         super().__init__()
         self.records = records
+        self.record_labels = [
+            f"{record.get('title', 'Unknown Title')} — {record.get('artist', 'Unknown Artist')}"
+            for record in records
+        ]
         self.meta_cache: dict[str, dict] = {}
+        self.meta_summaries: dict[str, dict[str, str | None]] = {}
         self.meta_lock = Lock()
+        self.meta_ready = Condition(self.meta_lock)
+        self.meta_in_flight: set[str] = set()
+        self.track_prefetch_song_id = ""
+        self.track_prefetch_worker: Worker | None = None
         self.current_index = 0
         self.current_song_id = ""
 
@@ -206,53 +624,69 @@ class SongResultsScreen(Screen):
         with Vertical(id="results_panel"):
             yield Static("Risultati ricerca:")
             with Horizontal(id="results_row"):
-                yield ListView(
-                    *(
-                        ListItem(
-                            Label(
-                                f"{record.get('title', 'Unknown Title')} — {record.get('artist', 'Unknown Artist')}"
-                            )
-                        )
-                        for record in self.records
-                    ),
-                    id="songs_list",
-                )
+                items = [ListItem(Label(label)) for label in self.record_labels]
+                yield ListView(*items, id="songs_list")
                 with Vertical(id="details_panel"):
                     yield Static("Dettagli brano:")
-                    yield Static("Select a song to view details.", id="song_details")
+                    self.song_details = Static("Select a song to view details.", id="song_details")
+                    yield self.song_details
             yield Button("Back", id="back_button")
 
     def on_mount(self) -> None:
         songs_list = self.query_one("#songs_list", ListView)
         songs_list.focus()
-        self._start_meta_prefetch()
+        self.prefetch_meta_worker()
         if self.records:
             songs_list.index = 0
             self._show_selected_song(0)
 
-    def _start_meta_prefetch(self) -> None:
-        Thread(target=self._prefetch_meta_worker, daemon=True).start()
+    @work(thread=True, exclusive=True, group="meta_prefetch")
+    def prefetch_meta_worker(self) -> None:
+        worker = get_current_worker()
+        song_ids: list[str] = []
+        with self.meta_lock:
+            for record in self.records:
+                song_id = str(record.get("songId", "")).strip()
+                if not song_id or song_id in self.meta_cache or song_id in self.meta_in_flight:
+                    continue
+                self.meta_in_flight.add(song_id)
+                song_ids.append(song_id)
 
-    def _prefetch_meta_worker(self) -> None:
-        for record in self.records:
-            song_id = str(record.get("songId", "")).strip()
-            if not song_id:
-                continue
+        if not song_ids:
+            return
 
-            with self.meta_lock:
-                if song_id in self.meta_cache:
-                    continue
+        executor = ThreadPoolExecutor(max_workers=_META_PREFETCH_WORKERS)
+        try:
+            futures = {executor.submit(search_song_meta, song_id): song_id for song_id in song_ids}
+            for future in as_completed(futures):
+                if worker.is_cancelled:
+                    break
 
-            try:
-                meta = search_song_meta(song_id)
-            except Exception:
-                continue
+                song_id = futures[future]
+                try:
+                    meta = future.result()
+                except Exception:
+                    meta = None
 
+                self._store_prefetched_meta(song_id, meta)
+        finally:
+            # Requests that have not started yet are dropped once the screen goes away.
+            executor.shutdown(wait=False, cancel_futures=True)
             with self.meta_lock:
+                self.meta_in_flight.difference_update(song_ids)
+                self.meta_ready.notify_all()
+
+    def _store_prefetched_meta(self, song_id: str, meta: dict | None) -> None:
+        summary = _summarize_song_meta(meta) if meta is not None else None
+        with self.meta_lock:
+            self.meta_in_flight.discard(song_id)
+            if meta is not None:
                 self.meta_cache[song_id] = meta
+                self.meta_summaries[song_id] = summary
+            self.meta_ready.notify_all()
 
-            if song_id == self.current_song_id:
-                self.app.call_from_thread(self._refresh_current_song_details)
+        if meta is not None and song_id == self.current_song_id:
+            self.app.call_from_thread(self._refresh_current_song_details)
 
     def _refresh_current_song_details(self) -> None:
         self._show_selected_song(self.current_index)
@@ -278,6 +712,91 @@ class SongResultsScreen(Screen):
 
         highlighted_index = event.list_view.index if event.list_view.index is not None else 0
         self._show_selected_song(highlighted_index)
+        self._start_track_prefetch(highlighted_index)
+
+    def _start_track_prefetch(self, index: int) -> None:
+        if index < 0 or index >= len(self.records):
+            return
+
+        song = self.records[index]
+        song_id = str(song.get("songId", "")).strip()
+        if not song_id:
+            return
+
+        # Dedupe on the live worker: a cancelled worker may still be unwinding, but
+        # it will not prefetch anything more, so the same song can start again.
+        worker = self.track_prefetch_worker
+        if (
+            song_id == self.track_prefetch_song_id
+            and worker is not None
+            and not worker.is_cancelled
+            and not worker.is_finished
+        ):
+            return
+
+        fallback_title = str(song.get("title") or "Unknown Title")
+        self.track_prefetch_song_id = song_id
+        self.track_prefetch_worker = self.prefetch_tracks_worker(song_id, fallback_title)
+
+    @work(thread=True, exclusive=True, group="track_prefetch")
+    def prefetch_tracks_worker(self, song_id: str, fallback_title: str) -> None:
+        worker = get_current_worker()
+        with self.meta_lock:
+            # Wait for the meta prefetch instead of requesting the same meta twice.
+            while song_id in self.meta_in_flight and not worker.is_cancelled:
+                self.meta_ready.wait(timeout=0.5)
+            if worker.is_cancelled:
+                return
+            meta = self.meta_cache.get(song_id)
+            if meta is None:
+                self.meta_in_flight.add(song_id)
+
+        if meta is None:
+            try:
+                meta = search_song_meta(song_id)
+            except Exception:
+                meta = None
+            self._store_prefetched_meta(song_id, meta)
+            if meta is None:
+                return
+
+        tracks_value = meta.get("tracks", [])
+        if not isinstance(tracks_value, list):
+            return
+
+        song_title = str(meta.get("title") or fallback_title)
+        meta_revision_id, meta_image = _meta_track_source(meta)
+        requests: dict[str, tuple[str, str, str]] = {}
+        for track_index, track in enumerate(track for track in tracks_value if isinstance(track, dict)):
+            track_id = str(track_index)
+            revision_id, image = _resolve_track_source(meta_revision_id, meta_image, track)
+            if not revision_id or not image:
+                continue
+            cache_key = _track_cache_key(song_id, revision_id, image, track_id)
+            if not _has_cached_track_json(cache_key):
+                requests[cache_key] = (revision_id, image, track_id)
+
+        if not requests:
+            return
+
+        executor = ThreadPoolExecutor(max_workers=_TRACK_PREFETCH_WORKERS)
+        try:
+            futures = {
+                executor.submit(get_song_tabs, song_id, revision_id, image, track_id): cache_key
+                for cache_key, (revision_id, image, track_id) in requests.items()
+            }
+            for future in as_completed(futures):
+                if worker.is_cancelled:
+                    break
+
+                try:
+                    track_json = future.result()
+                except Exception:
+                    continue
+                track_json = _enrich_track_json(track_json, meta, song_title)
+                _cache_track_json(futures[future], track_json)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def _show_selected_song(self, index: int) -> None:
         if index < 0 or index >= len(self.records):
@@ -292,16 +811,15 @@ class SongResultsScreen(Screen):
         self.current_song_id = song_id
 
         if not song_id:
-            self.query_one("#song_details", Static).update(
+            self.song_details.update(
                 f"Title: {title}\nArtist: {artist}\n\nNo songId available."
             )
             return
 
-        with self.meta_lock:
-            meta = self.meta_cache.get(song_id)
+        summary = self.meta_summaries.get(song_id)
 
-        if meta is None:
-            self.query_one("#song_details", Static).update(
+        if summary is None:
+            self.song_details.update(
                 "Song\n"
                 f"Title: {title}\n"
                 f"Song ID: {song_id}\n\n"
@@ -314,69 +832,18 @@ class SongResultsScreen(Screen):
             )
             return
 
-        meta_artist = meta.get("artist")
-        if isinstance(meta_artist, dict):
-            meta_artist_name = meta_artist.get("name") or artist
-        elif isinstance(meta_artist, str):
-            meta_artist_name = meta_artist
-        else:
-            meta_artist_name = artist
-
-        meta_author_name = "N/A"
-        author_candidates = [
-            meta.get("author"),
-            meta.get("tabAuthor"),
-            meta.get("composer"),
-            meta.get("username"),
-        ]
-        for candidate in author_candidates:
-            if isinstance(candidate, dict):
-                candidate_name = candidate.get("name") or candidate.get("username")
-                if isinstance(candidate_name, str) and candidate_name.strip():
-                    meta_author_name = candidate_name.strip()
-                    break
-            elif isinstance(candidate, str) and candidate.strip():
-                meta_author_name = candidate.strip()
-                break
-
-        tags_value = meta.get("tags", [])
-        if isinstance(tags_value, list):
-            parsed_tags: list[str] = []
-            for tag in tags_value:
-                if isinstance(tag, str):
-                    parsed_tags.append(tag)
-                elif isinstance(tag, dict):
-                    name = tag.get("name")
-                    if isinstance(name, str):
-                        parsed_tags.append(name)
-            tags_text = ", ".join(parsed_tags) if parsed_tags else "N/A"
-        else:
-            tags_text = "N/A"
-
-        tracks = meta.get("tracks", [])
-        instrument_names: list[str] = []
-        if isinstance(tracks, list):
-            for track in tracks:
-                if isinstance(track, dict):
-                    instrument_name = track.get("instrument")
-                    if isinstance(instrument_name, str) and instrument_name:
-                        instrument_names.append(instrument_name)
-
-        unique_instruments = sorted(set(instrument_names))
-        instruments_text = ", ".join(unique_instruments) if unique_instruments else "N/A"
-
         details_text = (
             "Song\n"
-            f"Title: {meta.get('title', title)}\n"
+            f"Title: {summary['title'] if summary['title'] is not None else title}\n"
             f"Song ID: {song_id}\n\n"
             "People\n"
-            f"Artist: {meta_artist_name}\n"
-            f"Author: {meta_author_name}\n\n"
+            f"Artist: {summary['artist'] if summary['artist'] is not None else artist}\n"
+            f"Author: {summary['author']}\n\n"
             "Meta\n"
-            f"Tags: {tags_text}\n"
-            f"Available instruments: {instruments_text}"
+            f"Tags: {summary['tags_text']}\n"
+            f"Available instruments: {summary['instruments_text']}"
         )
-        self.query_one("#song_details", Static).update(details_text)
+        self.song_details.update(details_text)
 
     def _open_track_selection(self, index: int) -> None:
         if index < 0 or index >= len(self.records):
@@ -387,22 +854,23 @@ class SongResultsScreen(Screen):
         if not song_id:
             return
 
-        with self.meta_lock:
-            meta = self.meta_cache.get(song_id)
+        meta = self.meta_cache.get(song_id)
 
         if meta is None:
             try:
                 meta = search_song_meta(song_id)
             except Exception as exc:
-                self.query_one("#song_details", Static).update(f"Meta request failed:\n{exc}")
+                self.song_details.update(f"Meta request failed:\n{exc}")
                 return
+            summary = _summarize_song_meta(meta)
             with self.meta_lock:
                 self.meta_cache[song_id] = meta
+                self.meta_summaries[song_id] = summary
 
         tracks_value = meta.get("tracks", [])
         tracks = [track for track in tracks_value if isinstance(track, dict)] if isinstance(tracks_value, list) else []
         if not tracks:
-            self.query_one("#song_details", Static).update("No tracks available for this song.")
+            self.song_details.update("No tracks available for this song.")
             return
 
         song_title = str(meta.get("title") or song.get("title") or "Unknown Title")
@@ -444,25 +912,23 @@ class TrackSelectionScreen(Screen):
         self.song_id = song_id
         self.song_title = song_title
         self.tracks = tracks
+        self.track_labels = [
+            f"{track.get('name', 'Unnamed Track')} — {track.get('instrument', 'Unknown Instrument')}"
+            for track in tracks
+        ]
         self.meta = meta
-        self.track_json_cache: dict[str, dict] = {}
+        # Revision and image come from the song meta and are shared by every track;
+        # the per-track fields are only a fallback when the meta lacks them.
+        self.meta_revision_id, self.meta_image = _meta_track_source(meta)
 
     def compose(self) -> ComposeResult:
         with Vertical(id="track_panel"):
             yield Static(f"Tracks for: {self.song_title}")
-            yield ListView(
-                *(
-                    ListItem(
-                        Label(
-                            f"{track.get('name', 'Unnamed Track')} — {track.get('instrument', 'Unknown Instrument')}"
-                        )
-                    )
-                    for track in self.tracks
-                ),
-                id="tracks_list",
-            )
+            items = [ListItem(Label(label)) for label in self.track_labels]
+            yield ListView(*items, id="tracks_list")
             yield Button("Back", id="track_back_button")
-            yield Static("Select a track to view details.", id="track_details")
+            self.track_details = Static("Select a track to view details.", id="track_details")
+            yield self.track_details
 
     def on_mount(self) -> None:
         tracks_list = self.query_one("#tracks_list", ListView)
@@ -489,7 +955,7 @@ class TrackSelectionScreen(Screen):
             return
         track_index = event.list_view.index if event.list_view.index is not None else 0
         self._show_track_details(track_index)
-        self.query_one("#track_details", Static).update("Converting ...")
+        self.track_details.update("Converting ...")
         self._fetch_selected_track_json(track_index)
 
     def _show_track_details(self, index: int) -> None:
@@ -511,7 +977,7 @@ class TrackSelectionScreen(Screen):
             f"Views: {views}\n"
             f"Hash: {track_hash}"
         )
-        self.query_one("#track_details", Static).update(details)
+        self.track_details.update(details)
 
     def _fetch_selected_track_json(self, index: int) -> None:
         if index < 0 or index >= len(self.tracks):
@@ -520,24 +986,10 @@ class TrackSelectionScreen(Screen):
         track = self.tracks[index]
         selected_track_id = str(index)
 
-        revision_id = str(
-            self.meta.get("revisionId")
-            or self.meta.get("revision")
-            or track.get("revisionId")
-            or track.get("revision")
-            or ""
-        ).strip()
-
-        image = str(
-            self.meta.get("image")
-            or self.meta.get("imageId")
-            or track.get("image")
-            or track.get("imageId")
-            or ""
-        ).strip()
+        revision_id, image = _resolve_track_source(self.meta_revision_id, self.meta_image, track)
 
         if not revision_id or not image or not selected_track_id:
-            self.query_one("#track_details", Static).update(
+            self.track_details.update(
                 "Track\n"
                 "Unable to build track JSON URL.\n"
                 f"revision_id={revision_id or 'missing'}\n"
@@ -546,69 +998,18 @@ class TrackSelectionScreen(Screen):
             )
             return
 
-        cache_key = f"{self.song_id}:{revision_id}:{image}:{selected_track_id}"
-        if cache_key in self.track_json_cache:
-            track_json = self.track_json_cache[cache_key]
-        else:
+        cache_key = _track_cache_key(self.song_id, revision_id, image, selected_track_id)
+        track_json = _get_cached_track_json(cache_key)
+        if track_json is None:
             try:
                 track_json = get_song_tabs(self.song_id, revision_id, image, selected_track_id)
             except Exception as exc:
-                self.query_one("#track_details", Static).update(f"Track JSON request failed:\n{exc}")
+                self.track_details.update(f"Track JSON request failed:\n{exc}")
                 return
-            self.track_json_cache[cache_key] = track_json
-
-        if isinstance(track_json, dict):
-            enriched_track_json = dict(track_json)
-
-            song_title = str(self.meta.get("title") or self.song_title or "").strip()
-            if song_title:
-                enriched_track_json["songName"] = song_title
-                enriched_track_json["songTitle"] = song_title
-                enriched_track_json["title"] = song_title
-
-            artist_name = ""
-            meta_artist = self.meta.get("artist")
-            if isinstance(meta_artist, dict):
-                artist_name = str(meta_artist.get("name") or "").strip()
-            elif isinstance(meta_artist, str):
-                artist_name = meta_artist.strip()
-
-            if artist_name:
-                enriched_track_json["artist"] = artist_name
-
-            author_name = ""
-            for candidate in (
-                self.meta.get("author"),
-                self.meta.get("tabAuthor"),
-                self.meta.get("composer"),
-                self.meta.get("username"),
-            ):
-                if isinstance(candidate, dict):
-                    candidate_name = candidate.get("name") or candidate.get("username")
-                    if isinstance(candidate_name, str) and candidate_name.strip():
-                        author_name = candidate_name.strip()
-                        break
-                elif isinstance(candidate, str) and candidate.strip():
-                    author_name = candidate.strip()
-                    break
-
-            if author_name:
-                enriched_track_json["author"] = author_name
+            track_json = _enrich_track_json(track_json, self.meta, self.song_title)
+            _cache_track_json(cache_key, track_json)
 
-            editor_name = str(
-                self.meta.get("editor")
-                or self.meta.get("editedBy")
-                or self.meta.get("editorName")
-                or self.meta.get("revisionAuthor")
-                or self.meta.get("username")
-                or ""
-            ).strip()
-            if editor_name:
-                enriched_track_json["editor"] = editor_name
-
-            track_json = enriched_track_json
-
-        self.query_one("#track_details", Static).update(
+        self.track_details.update(
             "Track JSON\n"
             f"song_id={self.song_id}\n"
             f"revision_id={revision_id}\n"
@@ -617,9 +1018,23 @@ class TrackSelectionScreen(Screen):
             "Converting ..."
         )
 
+        self.convert_track_worker(track_json, revision_id, image, selected_track_id)
+
+    @work(thread=True, group="conversion")
+    def convert_track_worker(self, track_json: dict, revision_id: str, image: str, selected_track_id: str) -> None:
         success, message = send_json_to_score(track_json)
+        if get_current_worker().is_cancelled:
+            return
+
+        self.app.call_from_thread(
+            self._update_after_convert, revision_id, image, selected_track_id, success, message
+        )
+
+    def _update_after_convert(
+        self, revision_id: str, image: str, selected_track_id: str, success: bool, message: str
+    ) -> None:
         status_line = "Conversion status: success" if success else "Conversion status: error"
-        self.query_one("#track_details", Static).update(
+        self.track_details.update(
             "Track\n"
             f"song_id={self.song_id}\n"
             f"revision_id={revision_id}\n"